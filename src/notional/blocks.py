@@ -54,10 +54,13 @@ class Database(DataRecord, object="database"):
     @property
     def Title(self):
         """Return the title of this database as plain text."""
-        if self.title is None or len(self.title) == 0:
+
+        title = self.title
+
+        if not title:
             return None
 
-        return plain_text(*self.title)
+        return plain_text(*title)
 
 
 class Page(DataRecord, object="page"):
@@ -145,13 +148,14 @@ class TextBlock(Block, ABC):
     def __text__(self):
         """Provide shorthand access to the nested text content in this block."""
 
-        return self("rich_text")
+        return self._get_nested(self).rich_text
 
     @classmethod
     def __compose__(cls, *text):
         """Compose a `TextBlock` from the given text items."""
 
-        obj = cls()
+        # new blocks only contain default values, so validation is not needed
+        obj = cls.construct()
         obj.concat(*text)
 
         return obj
@@ -159,7 +163,11 @@ class TextBlock(Block, ABC):
     def concat(self, *text):
         """Concatenate text (either `RichTextObject` or `str` items) to this block."""
 
-        rtf = rich_text(*text)
+        # skip the conversion when callers provide rich text objects directly
+        if text and all(isinstance(obj, RichTextObject) for obj in text):
+            rtf = text
+        else:
+            rtf = rich_text(*text)
 
         # calling the block returns the nested data...  this helps deal with
         # sublcasses of `TextBlock` that each have different "type" attributes
@@ -182,7 +190,7 @@ class WithChildrenMixin:
     def __children__(self):
         """Provide short-hand access to the children in this block."""
 
-        return self("children")
+        return self._get_nested(self).children
 
     def __iadd__(self, block):
         """Append the given block to the children of this parent in place."""
@@ -204,6 +212,39 @@ class WithChildrenMixin:
 
         self.has_children = True
 
+    def walk(self):
+        """Iterate over this block and all of its descendants (depth-first).
+
+        The traversal uses an explicit stack rather than recursion, so it is safe to use
+        with deeply nested block trees.  Callers should prefer `for block in walk()`
+        over recursively visiting `__children__` on each block.
+        """
+
+        for node, _ in self._walk_with_depth():
+            yield node
+
+    def flatten(self):
+        """Return this block tree as a flat list of `(block, depth)` pairs.
+
+        Blocks appear in document order, with this block at depth `0`.  The result may
+        be iterated repeatedly (e.g. when rendering markdown) without walking the tree.
+        """
+        return list(self._walk_with_depth())
+
+    def _walk_with_depth(self):
+        """Iterate over `(block, depth)` pairs for this block and its descendants."""
+
+        stack = [(self, 0)]
+
+        while stack:
+            node, depth = stack.pop()
+            yield node, depth
+
+            children = getattr(node(), "children", None)
+
+            if children:
+                stack.extend((child, depth + 1) for child in reversed(children))
+
 
 class Paragraph(TextBlock, WithChildrenMixin, type="paragraph"):
     """A paragraph block in Notion."""
@@ -315,9 +356,8 @@ class Code(TextBlock, type="code"):
     @classmethod
     def __compose__(cls, text, lang=CodingLanguage.PLAIN_TEXT):
         """Compose a `Code` block from the given text and language."""
-        block = super().__compose__(text)
-        block.code.language = lang
-        return block
+        nested = cls._NestedData.construct(rich_text=rich_text(text), language=lang)
+        return cls.construct(code=nested)
 
     @property
     def Markdown(self):
@@ -492,7 +532,7 @@ class Embed(Block, type="embed"):
     @classmethod
     def __compose__(cls, url):
         """Create a new `Embed` block from the given URL."""
-        return Embed(embed=Embed._NestedData(url=url))
+        return cls.construct(embed=cls._NestedData.construct(url=url))
 
     @property
     def URL(self):
@@ -521,7 +561,7 @@ class Bookmark(Block, type="bookmark"):
     @classmethod
     def __compose__(cls, url):
         """Compose a new `Bookmark` block from a specific URL."""
-        return Bookmark(bookmark=Bookmark._NestedData(url=url))
+        return cls.construct(bookmark=cls._NestedData.construct(url=url))
 
     @property
     def URL(self):
@@ -549,7 +589,7 @@ class LinkPreview(Block, type="link_preview"):
     @classmethod
     def __compose__(cls, url):
         """Create a new `LinkPreview` block from the given URL."""
-        return LinkPreview(link_preview=LinkPreview._NestedData(url=url))
+        return cls.construct(link_preview=cls._NestedData.construct(url=url))
 
     @property
     def URL(self):
@@ -670,21 +710,14 @@ class TableRow(Block, type="table_row"):
     class _NestedData(GenericObject):
         cells: List[List[RichTextObject]] = None
 
-        def __getitem__(self, col):
-            """Return the cell content for the requested column.
-
-            This will raise an `IndexError` if there are not enough columns.
-            """
-            if col > len(self.cells):
-                raise IndexError()
-
-            return self.cells[col]
-
     table_row: _NestedData = _NestedData()
 
     def __getitem__(self, cell_num):
-        """Return the cell content for the requested column."""
-        return self.table_row[cell_num]
+        """Return the cell content for the requested column.
+
+        This will raise an `IndexError` if there are not enough columns.
+        """
+        return self.table_row.cells[cell_num]
 
     @classmethod
     def __compose__(cls, *cells):
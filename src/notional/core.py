@@ -1,9 +1,11 @@
 """Base classes for working with the Notion API."""
 
-import inspect
 import logging
+import sys
 from datetime import date, datetime
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 from typing import Optional
 from uuid import UUID
 
@@ -13,6 +15,46 @@ from pydantic.main import ModelMetaclass, validate_model
 logger = logging.getLogger(__name__)
 
 
+def _serialize_enum(data):
+    return data.value
+
+
+def _serialize_list(data):
+    return [serialize_to_api(value) for value in data]
+
+
+def _serialize_dict(data):
+    return {name: serialize_to_api(value) for name, value in data.items()}
+
+
+# converters for data types that will not directly serialize to JSON, along with the
+# containers that may hold them; subclasses are matched by inheritance
+_API_SERIALIZERS = {
+    date: date.isoformat,
+    datetime: datetime.isoformat,
+    UUID: str,
+    Enum: _serialize_enum,
+    list: _serialize_list,
+    tuple: _serialize_list,
+    dict: _serialize_dict,
+}
+
+# resolved converters by exact type (`None` for types that are already API-safe)
+_api_serializer_cache = dict.fromkeys((str, int, float, bool, type(None)))
+
+
+def _find_api_serializer(kind):
+    """Return the serializer for the given type by inspecting its bases."""
+
+    for base in kind.__mro__:
+        serializer = _API_SERIALIZERS.get(base)
+
+        if serializer is not None:
+            return serializer
+
+    return None
+
+
 def serialize_to_api(data):
     """Recursively convert the given data to an API-safe form.
 
@@ -21,22 +63,38 @@ def serialize_to_api(data):
 
     # https://github.com/samuelcolvin/pydantic/issues/1409
 
-    if isinstance(data, (date, datetime)):
-        return data.isoformat()
+    kind = type(data)
+
+    try:
+        serializer = _api_serializer_cache[kind]
+    except KeyError:
+        serializer = _api_serializer_cache[kind] = _find_api_serializer(kind)
+
+    if serializer is None:
+        return data
 
-    if isinstance(data, UUID):
-        return str(data)
+    return serializer(data)
 
-    if isinstance(data, Enum):
-        return data.value
 
-    if isinstance(data, (list, tuple)):
-        return [serialize_to_api(value) for value in data]
+@lru_cache(maxsize=None)
+def _find_property_setters(cls):
+    """Return the names of all properties with a setter in the given class."""
 
-    if isinstance(data, dict):
-        return {name: serialize_to_api(value) for name, value in data.items()}
+    setters = set()
+    visited = set()
 
-    return data
+    # names found earlier in the MRO take precedence over their base classes
+    for base in cls.__mro__:
+        for name, attr in vars(base).items():
+            if name in visited:
+                continue
+
+            visited.add(name)
+
+            if isinstance(attr, property) and attr.fset is not None:
+                setters.add(name)
+
+    return frozenset(setters)
 
 
 class ComposableObjectMeta(ModelMetaclass):
@@ -76,16 +134,18 @@ class ComposableObjectMeta(ModelMetaclass):
         an exception.
         """
 
-        if not hasattr(self, "__compose__"):
-            raise NotImplementedError(f"{self} does not support object composition")
+        compose_func = getattr(self, "__compose__", None)
 
-        compose_func = self.__compose__
+        if compose_func is None:
+            raise NotImplementedError(f"{self} does not support object composition")
 
         # __getitem__ only accepts a single parameter...  if the caller provides
         # multiple params, they will be converted and passed as a tuple.  this method
         # also accepts a list for readability when composing from ORM properties
 
-        if params and type(params) in (list, tuple):
+        kind = type(params)
+
+        if params and (kind is tuple or kind is list):
             return compose_func(*params)
 
         return compose_func(params)
@@ -98,6 +158,12 @@ class GenericObject(BaseModel, metaclass=ComposableObjectMeta):
     Notion API.  Properties in Title Case are provided for convenience.
     """
 
+    class Config:
+        """Pydantic configuration for all API objects."""
+
+        # nested objects are used as given; copies are made explicitly where needed
+        copy_on_model_validation = "none"
+
     def __setattr__(self, name, value):
         """Set the attribute of this object to a given value.
 
@@ -108,17 +174,11 @@ class GenericObject(BaseModel, metaclass=ComposableObjectMeta):
         try:
             super().__setattr__(name, value)
         except ValueError as err:
-            setters = inspect.getmembers(
-                object=self.__class__,
-                predicate=lambda x: isinstance(x, property) and x.fset is not None,
-            )
-            for setter_name, _ in setters:
-                if setter_name == name:
-                    object.__setattr__(self, name, value)
-                    break
-            else:
+            if name not in _find_property_setters(self.__class__):
                 raise err
 
+            object.__setattr__(self, name, value)
+
     @classmethod
     def _set_field_default(cls, name, default=None):
         """Modify the `BaseModel` field information for a specific class instance.
@@ -148,10 +208,12 @@ class GenericObject(BaseModel, metaclass=ComposableObjectMeta):
         if error:
             raise error
 
-        for name in fields:
-            value = values[name]
-            logger.debug("set object data -- %s => %s", name, value)
-            setattr(__notional_self__, name, value)
+        logger.debug("set object data -- %s", fields)
+
+        # values have already been validated, so apply them all at once rather than
+        # assigning each field individually
+        __notional_self__.__dict__.update({name: values[name] for name in fields})
+        __notional_self__.__fields_set__.update(fields)
 
         return __notional_self__
 
@@ -215,6 +277,9 @@ class TypedObject(GenericObject):
 
     type: str
 
+    # each direct child of TypedObject replaces this with its own map when defined
+    __notional_typemap__ = {}
+
     # modified from the methods described in this discussion:
     # - https://github.com/samuelcolvin/pydantic/discussions/3091
 
@@ -233,12 +298,7 @@ class TypedObject(GenericObject):
         returned.  Otherwise, the full contents of the NestedData will be returned.
         """
 
-        type = getattr(self, "type", None)
-
-        if type is None:
-            raise AttributeError("type not specified")
-
-        nested = getattr(self, type)
+        nested = self._get_nested(self)
 
         if field is not None:
             nested = getattr(nested, field)
@@ -262,15 +322,21 @@ class TypedObject(GenericObject):
     def _register_type(cls, name):
         """Register a specific class for the given 'type' name."""
 
+        # type names are compared frequently when parsing API data
+        name = sys.intern(name)
+
         cls._set_field_default("type", default=name)
 
+        # nested data is stored in a field with the same name as the type
+        cls._get_nested = attrgetter(name)
+
         # initialize a __notional_typemap__ map for each direct child of TypedObject
 
         # this allows different class trees to have the same 'type' name
         # but point to a different object (e.g. the 'date' type may have
         # different implementations depending where it is used in the API)
 
-        if not hasattr(cls, "__notional_typemap__"):
+        if TypedObject in cls.__bases__:
             cls.__notional_typemap__ = {}
 
         if name in cls.__notional_typemap__:
@@ -284,15 +350,13 @@ class TypedObject(GenericObject):
     def _resolve_type(cls, data):
         """Instantiate the correct object based on the 'type' field."""
 
-        if isinstance(data, cls):
+        # check the exact class first, since most objects are not subclassed further
+        if type(data) is cls or isinstance(data, cls):
             return data
 
         if not isinstance(data, dict):
             raise ValueError("Invalid 'data' object")
 
-        if not hasattr(cls, "__notional_typemap__"):
-            raise TypeError(f"Missing '__notional_typemap__' in {cls}")
-
         type_name = data.get("type")
 
         if type_name is None:
@@ -1,6 +1,7 @@
 """Iterator classes for working with paginated API responses."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, List, Optional
 
 from pydantic import validator
@@ -22,29 +23,10 @@ class ObjectList(NotionObject, TypedObject, object="list"):
     has_more: bool = False
     next_cursor: Optional[str] = None
 
-    @validator("results", pre=True, each_item=True)
+    @validator("results", pre=True)
     def _convert_results_list(cls, val):
         """Convert the results list to specifc objects."""
-
-        if "object" not in val:
-            raise ValueError("Unknown object in results")
-
-        if val["object"] == BlockList.type:
-            return Block.parse_obj(val)
-
-        if val["object"] == PageList.type:
-            return Page.parse_obj(val)
-
-        if val["object"] == DatabaseList.type:
-            return Database.parse_obj(val)
-
-        if val["object"] == PropertyItemList.type:
-            return PropertyItem.parse_obj(val)
-
-        if val["object"] == UserList.type:
-            return User.parse_obj(val)
-
-        return GenericObject.parse_obj(val)
+        return [_parse_result(item) for item in val]
 
 
 class BlockList(ObjectList, type="block"):
@@ -92,6 +74,26 @@ class PropertyItemList(ObjectList, type="property_item"):
     property_item: _NestedData = _NestedData()
 
 
+_RESULT_PARSERS = {
+    BlockList.type: Block.parse_obj,
+    PageList.type: Page.parse_obj,
+    DatabaseList.type: Database.parse_obj,
+    PropertyItemList.type: PropertyItem.parse_obj,
+    UserList.type: User.parse_obj,
+}
+
+
+def _parse_result(val):
+    """Parse a single item from an API result list into its specific object."""
+
+    if "object" not in val:
+        raise ValueError("Unknown object in results")
+
+    parser = _RESULT_PARSERS.get(val["object"], GenericObject.parse_obj)
+
+    return parser(val)
+
+
 class EndpointIterator:
     """Iterates over results from a paginated API response.
 
@@ -114,15 +116,31 @@ class EndpointIterator:
     types).
     """
 
-    def __init__(self, endpoint, datatype=None):
+    __slots__ = (
+        "_endpoint",
+        "_datatype",
+        "_prefetch",
+        "has_more",
+        "page_num",
+        "total_items",
+        "next_cursor",
+    )
+
+    def __init__(self, endpoint, datatype=None, prefetch=False):
         """Initialize an object list iterator for the specified endpoint.
 
         If a class is provided, it will be constructued for each result returned by
         this iterator.  The constructor must accept a single argument, which is the
         `NotionObject` contained in the `ObjectList`.
+
+        If `prefetch` is enabled, the next page of results will be requested in the
+        background while the current page is consumed.  This hides some of the API
+        latency for large result sets, at the cost of an extra request when callers
+        stop iterating early.
         """
         self._endpoint = endpoint
         self._datatype = datatype
+        self._prefetch = prefetch
 
         self.has_more = None
         self.page_num = -1
@@ -136,35 +154,58 @@ class EndpointIterator:
         self.page_num = 0
         self.total_items = 0
 
-        if "page_size" not in kwargs:
-            kwargs["page_size"] = MAX_PAGE_SIZE
+        kwargs.setdefault("page_size", MAX_PAGE_SIZE)
 
         self.next_cursor = kwargs.pop("start_cursor", None)
 
-        while self.has_more:
-            self.page_num += 1
+        endpoint = self._endpoint
+        datatype = self._datatype
 
-            page = self._endpoint(start_cursor=self.next_cursor, **kwargs)
+        executor = ThreadPoolExecutor(max_workers=1) if self._prefetch else None
+        pending = None
 
-            api_list = ObjectList.parse_obj(page)
+        try:
+            while self.has_more:
+                self.page_num += 1
 
-            for obj in api_list.results:
-                self.total_items += 1
-
-                if self._datatype is None:
-                    yield obj
+                if pending is None:
+                    page = endpoint(start_cursor=self.next_cursor, **kwargs)
                 else:
-                    yield self._datatype(obj)
+                    page = pending.result()
+                    pending = None
 
-            self.next_cursor = api_list.next_cursor
-            self.has_more = api_list.has_more and self.next_cursor is not None
+                # the page envelope comes straight from the API, so only the
+                # individual results are parsed (rather than the whole ObjectList)
+                has_more = page.get("has_more", False)
+                next_cursor = page.get("next_cursor")
 
-    def list(self, **kwargs):
-        """Collect all items from the endpoint as a list."""
+                if executor and has_more and next_cursor:
+                    logger.debug("prefetching page :: %s", next_cursor)
+                    pending = executor.submit(
+                        endpoint, start_cursor=next_cursor, **kwargs
+                    )
 
-        items = []
+                for val in page.get("results", []):
+                    obj = _parse_result(val)
+                    self.total_items += 1
 
-        for item in self(**kwargs):
-            items.append(item)
+                    if datatype is None:
+                        yield obj
+                    else:
+                        yield datatype(obj)
 
-        return items
+                self.next_cursor = next_cursor
+                self.has_more = has_more and next_cursor is not None
+
+        finally:
+            # don't wait for a prefetched page that will never be used (this
+            # only helps if the request has not started yet)
+            if pending is not None:
+                pending.cancel()
+
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def list(self, **kwargs):
+        """Collect all items from the endpoint as a list."""
+        return list(self(**kwargs))
@@ -20,11 +20,22 @@ logger = logging.getLogger(__name__)
 class ConnectedProperty:
     """Contains the information and methods needed for a connected property.
 
-    When created, this object does not have a reference to its parent object.  Before
-    this property is accessed for the first time, callers must use `bind()` to set the
-    containing object at runtime.
+    This object is a descriptor; it is assigned as a class attribute of a
+    `ConnectedPage` and reads the page data and session from the instance on each
+    access, so a single property may be shared by all pages of a given type.
     """
 
+    __slots__ = (
+        "name",
+        "default",
+        "schema",
+        "data_type",
+        "type_name",
+        "value_type",
+        "_has_value",
+        "_has_compose",
+    )
+
     def __init__(self, name, schema, default=...):
         """Initialize the property wrapper.
 
@@ -59,28 +70,26 @@ class ConnectedProperty:
 
         self.value_type = PropertyValue.__notional_typemap__[self.type_name]
 
-    def bind(self, obj):
-        """Binds this property to the given object."""
-
-        if not isinstance(obj, ConnectedPage):
-            raise TypeError("Properties must be used in a ConnectedPage object")
+        # these do not change for a given value type, so only check them once
+        self._has_value = hasattr(self.value_type, "Value")
+        self._has_compose = hasattr(self.value_type, "__compose__")
 
-        # XXX should we do any additional error checking on the object?
+    def __get__(self, obj, owner=None):
+        """Return the current value of the property as a python object."""
 
-        self.parent = obj
-        self.page_data = self.parent._notional__page
-        self.session = self.parent._notional__session
+        if obj is None:
+            return self
 
-    def get(self):
-        """Return the current value of the property as a python object."""
         logger.debug("fget :: %s [%s]", self.type_name, self.name)
 
+        page_data = obj._notional__page
+
         # TODO raise instead?
-        if self.page_data is None:
+        if page_data is None:
             return None
 
         try:
-            prop = self.page_data[self.name]
+            prop = page_data[self.name]
         except AttributeError as err:
             if self.default == ...:
                 raise err
@@ -89,47 +98,56 @@ class ConnectedProperty:
         if not isinstance(prop, self.value_type):
             raise TypeError("Type mismatch")
 
-        if hasattr(prop, "Value"):
+        if self._has_value:
             return prop.Value
 
         return prop
 
-    def set(self, value):
+    def __set__(self, obj, value):
         """Set the property to the given value."""
         logger.debug("fset :: %s [%s] => %s", self.type_name, self.name, type(value))
 
+        page_data = obj._notional__page
+
         # TODO raise instead?
-        if self.page_data is None:
+        if page_data is None:
             return
 
-        if isinstance(value, self.value_type):
-            prop = value
+        prop = self.compose(value)
 
-        elif hasattr(self.value_type, "__compose__"):
-            prop = self.value_type[value]
+        # update the property on the server (which will refresh the local data)
+        obj._notional__session.pages.update(page_data, **{self.name: prop})
 
-        else:
-            raise TypeError(f"Unsupported value type for {self.type_name}")
+    def compose(self, value):
+        """Return a property value of the correct type for the given value."""
 
-        # update the property on the server (which will refresh the local data)
-        self.session.pages.update(self.page_data, **{self.name: prop})
+        if isinstance(value, self.value_type):
+            return value
+
+        if self._has_compose:
+            return self.value_type[value]
 
-    def delete(self):
+        raise TypeError(f"Unsupported value type for {self.type_name}")
+
+    def __delete__(self, obj):
         """Delete the value associated with this property."""
 
+        page_data = obj._notional__page
+
         # TODO raise instead?
-        if self.page_data is None:
+        if page_data is None:
             return
 
         empty = self.value_type()
 
-        self.session.pages.update(self.page_data, **{self.name: empty})
+        obj._notional__session.pages.update(page_data, **{self.name: empty})
 
 
 def Property(name, schema=None, default=...):
     """Define a property for a Notion Page object.
 
-    Internally, this method uses a custom wrapper to manage the property methods.
+    Internally, this method returns a `ConnectedProperty` descriptor to manage the
+    property methods.
 
     :param name: the Notion table property name
     :param schema: the schema that defines this property (default = RichText)
@@ -144,29 +162,12 @@ def Property(name, schema=None, default=...):
     elif not isinstance(schema, PropertyObject):
         raise TypeError("Invalid data_type; not a PropertyObject")
 
-    cprop = ConnectedProperty(
+    return ConnectedProperty(
         name=name,
         schema=schema,
         default=default,
     )
 
-    def fget(self):
-        """Return the current value of the property as a python object."""
-        cprop.bind(self)
-        return cprop.get()
-
-    def fset(self, value):
-        """Set the property to the given value."""
-        cprop.bind(self)
-        cprop.set(value)
-
-    def fdel(self):
-        """Delete the value for this property."""
-        cprop.bind(self)
-        cprop.delete()
-
-    return property(fget, fset, fdel)
-
 
 class ConnectedPage:
     """Base class for "live" pages via the Notion API.
@@ -181,6 +182,7 @@ class ConnectedPage:
             raise ValueError("Missing ID for connected page")
 
         self._notional__page = page
+        self._notional__children = None
 
     def __init_subclass__(cls, database=None, **kwargs):
         """Register new subclasses of a ConnectedPage."""
@@ -199,12 +201,28 @@ class ConnectedPage:
 
     @property
     def children(self):
-        """Return an iterator for all child blocks of this Page."""
+        """Return a list of all child blocks of this Page.
+
+        The children are loaded from the API on first access and reused until blocks
+        are appended to this page.  Changes made outside of `append()` will not be
+        seen until `reload_children()` is called.  The returned list is a copy, so
+        modifying it does not affect this page.
+        """
 
         if self._notional__page is None:
             return []
 
-        return self._notional__session.blocks.children.list(parent=self._notional__page)
+        if self._notional__children is None:
+            blocks = self._notional__session.blocks.children.list(
+                parent=self._notional__page
+            )
+            self._notional__children = list(blocks)
+
+        return list(self._notional__children)
+
+    def reload_children(self):
+        """Discard the cached child blocks so they are listed again on next access."""
+        self._notional__children = None
 
     @property
     def cover(self):
@@ -229,14 +247,14 @@ class ConnectedPage:
         """
 
         if isinstance(icon, str):
-            if icon.startswith(":"):
-                icon = emojize(icon, language="alias")
-            if is_emoji(icon):
-                icon = EmojiObject[icon]
-            elif icon.startswith("http"):
+            if icon.startswith("http"):
                 icon = ExternalFile[icon]
             else:
-                raise ValueError(f"Cannot interpret string `{icon}` as icon")
+                if icon.startswith(":"):
+                    icon = emojize(icon, language="alias")
+                if not is_emoji(icon):
+                    raise ValueError(f"Cannot interpret string `{icon}` as icon")
+                icon = EmojiObject[icon]
 
         elif not isinstance(icon, (EmojiObject, ExternalFile)):
             raise ValueError("Invalid icon specifier; unsupported type")
@@ -273,6 +291,9 @@ class ConnectedPage:
 
         self._notional__session.blocks.children.append(self._notional__page, *blocks)
 
+        # the cached children are out of date; reload them on next access
+        self.reload_children()
+
     @classmethod
     def bind(cls, to_session):
         """Attach this ConnectedPage to the given session.
@@ -316,14 +337,25 @@ class ConnectedPage:
         logger.debug("creating new %s :: %s", cls, cls._notional__database)
         parent = DatabaseRef(database_id=cls._notional__database)
 
-        page = cls._notional__session.pages.create(parent=parent)
+        properties = {}
+        attrs = {}
+
+        # connected properties are sent with the new page in a single request; any
+        # other attributes are set individually once the page exists
+        for name, value in kwargs.items():
+            cprop = getattr(cls, name, None)
+
+            if isinstance(cprop, ConnectedProperty):
+                properties[cprop.name] = cprop.compose(value)
+            else:
+                attrs[name] = value
+
+        page = cls._notional__session.pages.create(parent=parent, properties=properties)
         logger.debug("=> connected page :: %s", page.id)
 
         connected = cls(page)
 
-        # FIXME it would be better to convert properties to a dict and pass to the API,
-        # rather than setting them individually here...
-        for name, value in kwargs.items():
+        for name, value in attrs.items():
             setattr(connected, name, value)
 
         return connected
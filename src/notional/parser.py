@@ -9,11 +9,14 @@ future, which would effectively render these parsers unnecessary.
 # TODO look for options to handle text styled using CSS
 # TODO consider how to handle <form> content
 
+import base64
 import csv
 import io
 import logging
 import re
+import sys
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from os.path import basename
 
 import html5lib
@@ -21,6 +24,13 @@ import html5lib
 from . import blocks, schema, types
 from .text import Annotations, TextObject, lstrip, rstrip, truncate
 
+# html5-parser is an optional (C-based) replacement for html5lib; it also refuses to
+# load when its libxml2 does not match the one used by lxml
+try:
+    import html5_parser
+except (ImportError, RuntimeError):
+    html5_parser = None
+
 logger = logging.getLogger(__name__)
 
 # parse embedded image data
@@ -30,10 +40,23 @@ img_data_re = re.compile("^data:image/([^;]+);([^,]+),(.+)$")
 def condense_text(text):
     """Collapse contiguous whitespace from the given text."""
 
-    if text is None:
-        return None
+    if not text:
+        return text
+
+    condensed = " ".join(text.split())
+
+    # whitespace only collapses to a single space
+    if not condensed:
+        return " "
+
+    # keep a single space at the edges (e.g. for spacing between inline tags)
+    if text[0].isspace():
+        condensed = " " + condensed
 
-    return re.sub(r"\s+", " ", text, flags=re.MULTILINE)
+    if text[-1].isspace():
+        condensed += " "
+
+    return condensed
 
 
 def normalize_text(text):
@@ -50,7 +73,7 @@ def normalize_text(text):
 def gather_text(elem):
     """Return all text from the element and children."""
     text = "".join(elem.itertext())
-    return normalize_text(text)
+    return " ".join(text.split())
 
 
 def strip_text_block(block):
@@ -80,20 +103,42 @@ def elem_has_text(elem, with_children=True):
     if elem.text is not None and not elem.text.isspace():
         return True
 
-    # now, we need to check the tail of each child...
-    for child in elem:
-        if with_children and elem_has_text(child):
-            return True
+    # without children, only the tail of each direct child is visible text...
+    if not with_children:
+        for child in elem:
+            if child.tail is not None and not child.tail.isspace():
+                return True
 
-        if child.tail is None:
-            continue
+        return False
 
-        if not child.tail.isspace():
+    # otherwise, walk the full subtree once (rather than recursing per child)
+    for node in elem.iter():
+        if node.text is not None and not node.text.isspace():
+            return True
+
+        if node is not elem and node.tail is not None and not node.tail.isspace():
             return True
 
     return False
 
 
+@lru_cache(maxsize=None)
+def _find_tag_renderers(cls):
+    """Return a mapping of tag names to `_render_*` methods for the given class.
+
+    The result is cached per parser class, so subclasses may add or override render
+    methods as usual.
+    """
+
+    prefix = "_render_"
+
+    return {
+        sys.intern(name[len(prefix) :]): getattr(cls, name)
+        for name in dir(cls)
+        if name.startswith(prefix)
+    }
+
+
 class DocumentParser(ABC):
     """Base class for document parsers."""
 
@@ -159,7 +204,8 @@ class CsvParser(DocumentParser):
 
         self.schema = {}
 
-        self._field_names = []
+        # field names (in column order) mapped to their property value type
+        self._field_types = {}
 
     def parse(self, data):
         """Parse the given CSV data.
@@ -208,35 +254,26 @@ class CsvParser(DocumentParser):
         for field in fields:
             field = field.strip()
 
-            while field in self._field_names:
+            while field in self._field_types:
                 field = f"{field}_{column}"
 
             if column == self._title_index:
                 self.schema[field] = schema.Title()
+                self._field_types[field] = types.Title
             else:
                 self.schema[field] = schema.RichText()
-
-            self._field_names.append(field)
+                self._field_types[field] = types.RichText
 
             column += 1
 
     def _build_record(self, *fields):
-        if len(fields) != len(self._field_names):
+        if len(fields) != len(self._field_types):
             raise ValueError("Invalid CSV: incorrect number of fields in data")
 
-        record = {}
-
-        column = 0
-
-        for col in self._field_names:
-            value = fields[column]
-
-            if column == self._title_index:
-                record[col] = types.Title[value]
-            else:
-                record[col] = types.RichText[value]
-
-            column += 1
+        record = {
+            name: kind[value]
+            for (name, kind), value in zip(self._field_types.items(), fields)
+        }
 
         self.content.append(record)
 
@@ -270,7 +307,16 @@ class HtmlParser(DocumentParser):
         """
         super().parse(data)
 
-        doc = html5lib.parse(data, namespaceHTMLElements=False)
+        # prefer the (much faster) C parser when it is available
+        if html5_parser is None:
+            doc = html5lib.parse(data, namespaceHTMLElements=False)
+        else:
+            if hasattr(data, "read"):
+                data = data.read()
+
+            doc = html5_parser.parse(
+                data, treebuilder="lxml", namespace_elements=False, sanitize_names=True
+            )
 
         self._render(doc)
 
@@ -288,10 +334,11 @@ class HtmlParser(DocumentParser):
         if parent is None:
             parent = self.content
 
-        if hasattr(self, f"_render_{elem.tag}"):
+        render = _find_tag_renderers(type(self)).get(elem.tag)
+
+        if render is not None:
             logger.debug("handler func -- _render_%s", elem.tag)
-            pfunc = getattr(self, f"_render_{elem.tag}")
-            pfunc(elem, parent)
+            render(self, elem, parent)
 
         logger.debug("block complete; %d total block(s)", len(self.content))
 
@@ -311,9 +358,7 @@ class HtmlParser(DocumentParser):
             self._base_url = base
 
     def _render_blockquote(self, elem, parent):
-        block = blocks.Quote()
-        self._process_contents(elem, parent=block)
-        parent.append(block)
+        self._process_block(elem, parent, blocks.Quote)
 
     def _render_body(self, elem, parent):
         self._process_contents(elem, parent=parent)
@@ -339,9 +384,7 @@ class HtmlParser(DocumentParser):
         self._process_contents(elem, parent)
 
     def _render_dl(self, elem, parent):
-        dl = blocks.Paragraph()
-        self._process_contents(elem, parent=dl)
-        parent.append(dl)
+        self._process_block(elem, parent, blocks.Paragraph)
 
     def _render_dt(self, elem, parent):
         self._process_contents(elem, parent=parent)
@@ -350,19 +393,13 @@ class HtmlParser(DocumentParser):
         self._render_i(elem, parent)
 
     def _render_h1(self, elem, parent):
-        h1 = blocks.Heading1()
-        self._process_contents(elem, parent=h1)
-        parent.append(h1)
+        self._process_block(elem, parent, blocks.Heading1)
 
     def _render_h2(self, elem, parent):
-        h2 = blocks.Heading2()
-        self._process_contents(elem, parent=h2)
-        parent.append(h2)
+        self._process_block(elem, parent, blocks.Heading2)
 
     def _render_h3(self, elem, parent):
-        h3 = blocks.Heading3()
-        self._process_contents(elem, parent=h3)
-        parent.append(h3)
+        self._process_block(elem, parent, blocks.Heading3)
 
     def _render_h4(self, elem, parent):
         self._render_h3(elem, parent)
@@ -434,14 +471,10 @@ class HtmlParser(DocumentParser):
         self._process_list(elem, parent, blocks.NumberedListItem)
 
     def _render_p(self, elem, parent):
-        para = blocks.Paragraph()
-        self._process_contents(elem, parent=para)
-        parent.append(para)
+        self._process_block(elem, parent, blocks.Paragraph)
 
     def _render_pre(self, elem, parent):
-        block = blocks.Code()
-        self._process_contents(elem, parent=block)
-        parent.append(block)
+        self._process_block(elem, parent, blocks.Code)
 
     def _render_s(self, elem, parent):
         self._render_del(elem, parent)
@@ -526,17 +559,23 @@ class HtmlParser(DocumentParser):
         """
         logger.debug("appending text :: %s => '%s'", parent.type, truncate(text, 10))
 
+        if isinstance(parent, blocks.TextBlock):
+            if text is None:
+                return
+
+        # TableRow's add a cell for every call, so they always need the text object
+        elif not isinstance(parent, blocks.TableRow):
+            return
+
         if not isinstance(parent, blocks.Code):
             text = condense_text(text)
 
         obj = TextObject[text, self._current_href, self._current_text_style]
 
-        if isinstance(parent, blocks.TextBlock):
-            if obj is not None:
-                parent.concat(obj)
-
-        elif isinstance(parent, blocks.TableRow):
+        if isinstance(parent, blocks.TableRow):
             parent.append(obj)
+        else:
+            parent.concat(obj)
 
     def _process_contents(self, elem, parent):
         """Process the contents of the given element as children of `parent`.
@@ -576,6 +615,17 @@ class HtmlParser(DocumentParser):
         if isinstance(parent, blocks.TextBlock):
             strip_text_block(parent)
 
+    def _process_block(self, elem, parent, kind):
+        """Process contents of the given element as a new block.
+
+        :param elem: the element to process
+        :param parent: the parent for the new block
+        :param kind: the class used to create the new block
+        """
+        block = kind()
+        self._process_contents(elem, parent=block)
+        parent.append(block)
+
     def _process_list(self, elem, parent, kind):
         """Process contents of the given element as a list.
 
@@ -594,14 +644,15 @@ class HtmlParser(DocumentParser):
                 self._render(child, list_parent)
 
     def _process_img_data(self, elem):
-        import base64
-        import tempfile
+        """Decode the embedded image data in the given `<img>` element.
 
+        Returns a tuple with the image type (e.g. "png") and the decoded bytes.
+        """
         logger.debug("processing image")
 
         # TODO this probably needs more error handling and better flow
 
-        img_src = elem["src"]
+        img_src = elem.get("src")
         m = img_data_re.match(img_src)
 
         if m is None:
@@ -615,15 +666,10 @@ class HtmlParser(DocumentParser):
 
         if img_data_enc == "base64":
             logger.debug("decoding base64 image: %d bytes", len(img_data_str))
-            img_data_b64 = img_data_str.encode("ascii")
-            img_data = base64.b64decode(img_data_b64)
+            img_data = base64.b64decode(img_data_str)
         else:
             raise ValueError(f"Unsupported img encoding: {img_data_enc}")
 
-        logger.debug("preparing %d bytes for image upload", len(img_data))
-
-        with tempfile.NamedTemporaryFile(suffix=f".{img_type}") as fp:
-            logger.debug("using temporary file: %s", fp.name)
-            fp.write(img_data)
+        # TODO upload the image to Notion
 
-            # TODO upload the image to Notion
+        return img_type, img_data
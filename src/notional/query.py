@@ -231,6 +231,13 @@ class Query(GenericObject):
         return value
 
 
+# timestamp filters, keyed by the `timestamp` value in QueryBuilder.filter()
+_TIMESTAMP_FILTERS = {
+    TimestampKind.CREATED_TIME: CreatedTimeFilter,
+    TimestampKind.LAST_EDITED_TIME: LastEditedTimeFilter,
+}
+
+
 class QueryBuilder:
     """A query builder for the Notion API.
 
@@ -253,16 +260,20 @@ class QueryBuilder:
 
         if filter is None:
             if isinstance(self.endpoint, SearchEndpoint):
-                filter = SearchFilter.parse_obj(kwargs)
+                kind = SearchFilter
             elif "property" in kwargs:
-                filter = PropertyFilter.parse_obj(kwargs)
-            elif "timestamp" in kwargs and kwargs["timestamp"] == "created_time":
-                filter = CreatedTimeFilter.parse_obj(kwargs)
-            elif "timestamp" in kwargs and kwargs["timestamp"] == "last_edited_time":
-                filter = LastEditedTimeFilter.parse_obj(kwargs)
+                kind = PropertyFilter
             else:
+                try:
+                    kind = _TIMESTAMP_FILTERS.get(kwargs.get("timestamp"))
+                except TypeError:
+                    kind = None
+
+            if kind is None:
                 raise ValueError("unrecognized filter")
 
+            filter = kind.parse_obj(kwargs)
+
         elif not isinstance(filter, QueryFilter):
             raise ValueError("filter must be of type QueryFilter")
 
@@ -276,7 +287,9 @@ class QueryBuilder:
 
         else:
             old_filter = self.query.filter
-            self.query.filter = CompoundFilter(and_=[old_filter, filter])
+
+            # both filters have already been validated; no need to do it again
+            self.query.filter = CompoundFilter.construct(and_=[old_filter, filter])
 
         return self
 
@@ -290,7 +303,7 @@ class QueryBuilder:
         if sort is None:
             sort = PropertySort(**kwargs)
 
-        elif not isinstance(filter, PropertySort):
+        elif not isinstance(sort, PropertySort):
             raise ValueError("sort must be of type PropertySort")
 
         # use multiple sorts when necessary
@@ -1,7 +1,6 @@
 """Utilities for working text, markdown & Rich Text in Notion."""
 
 import re
-from copy import deepcopy
 from enum import Enum
 from typing import Optional
 
@@ -266,7 +265,9 @@ class RichTextObject(TypedObject):
 
         # TODO convert markdown in text:str to RichText?
 
-        style = deepcopy(style)
+        # Annotations only hold scalar values, so a shallow copy is enough here
+        if style is not None:
+            style = style.copy()
 
         return cls(plain_text=text, href=href, annotations=style)
 
@@ -296,7 +297,9 @@ class TextObject(RichTextObject, type="text"):
 
         link = LinkObject(url=href) if href else None
         nested = TextObject._NestedData(content=text, link=link)
-        style = deepcopy(style)
+
+        if style is not None:
+            style = style.copy()
 
         return cls(
             plain_text=text,
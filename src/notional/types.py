@@ -604,6 +604,9 @@ class Status(NativeTypeMixin, PropertyValue, type="status"):
     def Value(self):
         """Return the value of this property as a string."""
 
+        if self.status is None:
+            return None
+
         return self.status.name
 
 
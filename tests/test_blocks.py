@@ -48,6 +48,60 @@ def test_append_none():
         para += None
 
 
+@pytest.fixture
+def nested_blocks():
+    """Return a small tree of nested blocks."""
+
+    inner = blocks.BulletedListItem["inner"]
+    outer = blocks.BulletedListItem["outer"]
+    outer.append(inner)
+
+    para = blocks.Paragraph["root"]
+    para.append(outer)
+    para.append(blocks.Divider())
+
+    return para
+
+
+def test_walk_nested_blocks(nested_blocks):
+    """Verify that walking a block tree visits each block in document order."""
+
+    walked = [block.type for block in nested_blocks.walk()]
+
+    assert walked == [
+        "paragraph",
+        "bulleted_list_item",
+        "bulleted_list_item",
+        "divider",
+    ]
+
+
+def test_flatten_nested_blocks(nested_blocks):
+    """Verify that flattening a block tree records the depth of each block."""
+
+    flat = [(block.Markdown, depth) for block, depth in nested_blocks.flatten()]
+
+    assert flat == [
+        ("root", 0),
+        ("- outer", 1),
+        ("- inner", 2),
+        ("---", 1),
+    ]
+
+
+def test_composed_blocks_match_validated():
+    """Verify that composed blocks are equivalent to fully validated blocks."""
+
+    code = blocks.Code["print('hello')", CodingLanguage.PYTHON]
+    assert blocks.Code.parse_obj(code.dict()) == code
+
+    para = blocks.Paragraph["hello world"]
+    assert blocks.Paragraph.parse_obj(para.dict()) == para
+
+    embed = blocks.Embed["https://www.bing.com/"]
+    assert blocks.Embed.parse_obj(embed.dict()) == embed
+
+
 def test_concat_none():
     """Ensure concatenating None to a text block results in empty text."""
 
@@ -60,6 +114,13 @@ def test_concat_none():
     assert para.PlainText == ""
 
 
+def test_compose_empty_list():
+    """Verify that an empty list is passed to `__compose__` as a single value."""
+
+    with pytest.raises(ValueError):
+        blocks.Paragraph[[]]
+
+
 @pytest.mark.vcr()
 def test_create_block(notion, test_area):
     """Create a single block and confirm its contents."""
@@ -1,12 +1,14 @@
 """Unit tests for Notional core objects."""
 
 import logging
+from datetime import date, datetime
 from enum import Enum
 from typing import List
+from uuid import UUID
 
 import pytest
 
-from notional.core import GenericObject, NotionObject, TypedObject
+from notional.core import GenericObject, NotionObject, TypedObject, serialize_to_api
 
 # keep logging output to a minimum for testing
 logging.basicConfig(level=logging.INFO)
@@ -212,3 +214,62 @@ def test_get_nested_data():
 
     assert complex.detail.key is None
     assert complex.detail.value == "bar"
+
+
+def test_serialize_to_api():
+    """Verify that data is converted to an API-safe form."""
+
+    data = {
+        "date": date(2022, 3, 14),
+        "datetime": datetime(2022, 3, 14, 15, 9, 26),
+        "uuid": UUID("5e3204b7-f2d8-496c-876f-7db2d16e5805"),
+        "enum": CustomTypes.TYPE_TWO,
+        "nested": [(1, 2.5), {"flag": True, "none": None}],
+    }
+
+    assert serialize_to_api(data) == {
+        "date": "2022-03-14",
+        "datetime": "2022-03-14T15:09:26",
+        "uuid": "5e3204b7-f2d8-496c-876f-7db2d16e5805",
+        "enum": "two",
+        "nested": [[1, 2.5], {"flag": True, "none": None}],
+    }
+
+
+def test_set_property_with_setter():
+    """Verify that property setters work on GenericObject's."""
+
+    class _Temperature(GenericObject):
+        celsius: float = 0
+
+        @property
+        def Fahrenheit(self):
+            return self.celsius * 9 / 5 + 32
+
+        @Fahrenheit.setter
+        def Fahrenheit(self, value):
+            self.celsius = (value - 32) * 5 / 9
+
+    temp = _Temperature()
+    temp.Fahrenheit = 212
+    assert temp.celsius == 100
+
+    with pytest.raises(ValueError):
+        temp.Kelvin = 373.15
+
+
+def test_refresh_object_data():
+    """Verify that refreshing an object validates and applies the new data."""
+
+    person = Person.parse_obj(ALICE)
+    assert person.pets is None
+
+    person.refresh(**BOB)
+
+    assert person.id == UUID(BOB["id"])
+    assert person.name == "Bob the Person"
+    assert isinstance(person.pets[0], Cat)
+    assert isinstance(person.pets[1], Dog)
+
+    with pytest.raises(ValueError):
+        person.refresh(**STAN)
@@ -29,3 +29,19 @@ def test_basic_csv_data_check():
     assert "last" in entry
     assert isinstance(entry["last"], types.RichText)
     assert entry["last"].Value == "two"
+
+
+def test_duplicate_csv_columns():
+    """Rename duplicate header fields so each column is kept."""
+
+    data = """name,note,note\none,two,three"""
+
+    parser = CsvParser(header_row=True)
+    parser.parse(data)
+
+    assert list(parser.schema) == ["name", "note", "note_2"]
+
+    entry = parser.content[0]
+
+    assert entry["note"].Value == "two"
+    assert entry["note_2"].Value == "three"
@@ -1,16 +1,31 @@
 """Unit tests for the Notional parsers."""
 
 import os
+from xml.etree import ElementTree
 
 import pytest
 
+import notional.parser
 from notional import blocks
-from notional.parser import HtmlParser
+from notional.parser import HtmlParser, condense_text, elem_has_text
 from notional.text import plain_text
 
 BASEDIR = os.path.dirname(os.path.abspath(__file__))
 
 
+@pytest.fixture(autouse=True, params=["html5lib", "html5_parser"])
+def html_backend(request, monkeypatch):
+    """Run each test against both of the supported HTML parsing backends."""
+
+    if request.param == "html5lib":
+        monkeypatch.setattr(notional.parser, "html5_parser", None)
+
+    elif notional.parser.html5_parser is None:
+        pytest.skip("html5-parser is not available")
+
+    return request.param
+
+
 def check_single_block(html, expected_type, expected_text=None):
     """Verify the given HTML is parsed into expected block."""
 
@@ -348,3 +363,65 @@ def test_table_cell_with_div():
         html="<table><tr><td><div>hidden DATA</div></td></tr></table>",
         expected=[["hidden DATA"]],
     )
+
+
+def test_elem_has_text():
+    """Find visible text in an element, including nested children and tails."""
+
+    elem = ElementTree.fromstring("<div> <p> <b>bold</b> </p> </div>")
+    assert elem_has_text(elem)
+    assert not elem_has_text(elem, with_children=False)
+
+    elem = ElementTree.fromstring("<div> <p> </p> <p> </p>tail</div>")
+    assert elem_has_text(elem)
+    assert elem_has_text(elem, with_children=False)
+
+    elem = ElementTree.fromstring("<div> <p> <b> </b> </p> </div>")
+    assert not elem_has_text(elem)
+
+
+def test_condense_text():
+    """Collapse whitespace while keeping a single space at the edges."""
+
+    assert condense_text(None) is None
+    assert condense_text("") == ""
+    assert condense_text(" \n\t ") == " "
+    assert condense_text("some  \n text") == "some text"
+    assert condense_text("  some text\n") == " some text "
+
+
+def test_custom_render_method():
+    """Verify that parser subclasses may handle additional tags."""
+
+    class _CalloutParser(HtmlParser):
+        def _render_aside(self, elem, parent):
+            callout = blocks.Callout()
+            self._process_contents(elem, parent=callout)
+            parent.append(callout)
+
+    parser = _CalloutParser()
+    parser.parse("<aside>Note well</aside>")
+
+    assert len(parser.content) == 1
+    assert isinstance(parser.content[0], blocks.Callout)
+    assert parser.content[0].PlainText == "Note well"
+
+
+def test_line_break_after_leading_whitespace():
+    """Keep a line break that follows leading whitespace in a block."""
+
+    html = """<p>\n  <br>\n  Some text\n</p>"""
+    para = check_single_block(html, blocks.Paragraph)
+
+    assert para.PlainText == "\n Some text"
+
+
+def test_embedded_image_data():
+    """Decode base64 image data from an `<img>` element."""
+
+    elem = ElementTree.fromstring('<img src="data:image/png;base64,iVBORw0KGgo=" />')
+
+    img_type, img_data = HtmlParser()._process_img_data(elem)
+
+    assert img_type == "png"
+    assert img_data == b"\x89PNG\r\n\x1a\n"
@@ -1 +1,79 @@
 """Unit tests for the Notional iterators."""
+
+from notional.blocks import Page
+from notional.iterator import EndpointIterator, ObjectList, PageList
+
+PAGE_IDS = [
+    "5e3204b7-f2d8-496c-876f-7db2d16e5805",
+    "e9de0b88-5ace-47e9-b569-1a8b01569e21",
+    "1e0042be-9407-4064-9bea-ecdcf6c2d78b",
+]
+
+
+def page_list(page_id, next_cursor=None):
+    """Return a single page of results as the Notion API would."""
+
+    return {
+        "object": "list",
+        "type": "page",
+        "page": {},
+        "results": [{"object": "page", "id": page_id}],
+        "has_more": next_cursor is not None,
+        "next_cursor": next_cursor,
+    }
+
+
+def mock_endpoint(start_cursor=None, **kwargs):
+    """Serve one result per page, using the page ID as the next cursor."""
+
+    idx = 0 if start_cursor is None else PAGE_IDS.index(start_cursor)
+    next_cursor = PAGE_IDS[idx + 1] if idx + 1 < len(PAGE_IDS) else None
+
+    return page_list(PAGE_IDS[idx], next_cursor)
+
+
+def test_iterate_all_pages():
+    """Verify that the iterator follows the cursor through all pages."""
+
+    pages = EndpointIterator(mock_endpoint)
+    results = pages.list()
+
+    assert [str(page.id) for page in results] == PAGE_IDS
+    assert pages.page_num == 3
+    assert pages.total_items == 3
+
+
+def test_prefetch_pages():
+    """Verify that prefetching returns the same results in the same order."""
+
+    pages = EndpointIterator(mock_endpoint, prefetch=True)
+    results = pages.list()
+
+    assert [str(page.id) for page in results] == PAGE_IDS
+    assert pages.page_num == 3
+    assert pages.total_items == 3
+
+
+def test_prefetch_stop_early():
+    """Verify that a prefetching iterator can be closed before the last page."""
+
+    pages = EndpointIterator(mock_endpoint, prefetch=True)
+    results = pages()
+
+    first = next(results)
+    results.close()
+
+    assert str(first.id) == PAGE_IDS[0]
+    assert pages.page_num == 1
+    assert pages.total_items == 1
+
+
+def test_parse_object_list():
+    """Verify that list results are converted to their specific types."""
+
+    api_list = ObjectList.parse_obj(page_list(PAGE_IDS[0]))
+
+    assert isinstance(api_list, PageList)
+    assert len(api_list.results) == 1
+    assert isinstance(api_list.results[0], Page)
+    assert str(api_list.results[0].id) == PAGE_IDS[0]
@@ -5,14 +5,14 @@ from uuid import uuid4
 import pytest
 
 from notional import blocks, schema, types
-from notional.orm import Property, connected_page
+from notional.orm import ConnectedProperty, Property, connected_page
 
 
 def test_property_type():
-    """Confirm that `Property()` returns a `property`."""
+    """Confirm that `Property()` returns a `ConnectedProperty`."""
 
     prop = Property("Special", schema.Title())
-    assert isinstance(prop, property)
+    assert isinstance(prop, ConnectedProperty)
 
 
 def test_invalid_property_types():
@@ -38,6 +38,102 @@ def test_invalid_base_class():
         connected_page(cls=_MySpecialPage)
 
 
+def test_create_sends_properties():
+    """Verify that `create()` sends all properties with the new page."""
+
+    class _MockPages:
+        def __init__(self):
+            self.requests = []
+
+        def create(self, parent, properties=None):
+            self.requests.append(properties)
+            return blocks.Page(id=uuid4(), properties=properties)
+
+    class _MockSession:
+        pages = _MockPages()
+
+    CustomPage = connected_page(session=_MockSession())
+
+    class _ConnectedModel(CustomPage):
+        __database__ = uuid4()
+
+        Name = Property("Name", schema.Title())
+        Index = Property("Index", schema.Number())
+
+    page = _ConnectedModel.create(Name="Batched", Index=7)
+
+    assert len(_MockSession.pages.requests) == 1
+    assert set(_MockSession.pages.requests[0]) == {"Name", "Index"}
+
+    assert page.Name == "Batched"
+    assert page.Index == 7
+
+
+def test_children_are_cached(local_model):
+    """Verify that child blocks are only listed again after appending."""
+
+    class _MockChildren:
+        def __init__(self):
+            self.blocks = []
+            self.num_lists = 0
+
+        def list(self, parent):
+            self.num_lists += 1
+            return iter(self.blocks)
+
+        def append(self, parent, *blocks):
+            self.blocks.extend(blocks)
+
+    class _MockBlocks:
+        children = _MockChildren()
+
+    class _MockSession:
+        blocks = _MockBlocks()
+
+    local_model.bind(_MockSession())
+    page = local_model(blocks.Page(id=uuid4()))
+
+    assert page.children == []
+    assert page.children == []
+    assert _MockSession.blocks.children.num_lists == 1
+
+    page += blocks.Divider()
+
+    assert len(page.children) == 1
+    assert _MockSession.blocks.children.num_lists == 2
+
+    page.children.clear()
+    assert len(page.children) == 1
+
+    page.reload_children()
+
+    assert len(page.children) == 1
+    assert _MockSession.blocks.children.num_lists == 3
+
+
+def test_icon_strings(local_model):
+    """Verify that icon strings are converted to the correct icon type."""
+
+    class _MockPages:
+        def set(self, page, icon):
+            self.icon = icon
+
+    class _MockSession:
+        pages = _MockPages()
+
+    local_model.bind(_MockSession())
+    page = local_model(blocks.Page(id=uuid4()))
+
+    page.icon = ":hamburger:"
+    assert _MockSession.pages.icon == types.EmojiObject["🍔"]
+
+    page.icon = "https://example.com/icon.png"
+    assert isinstance(_MockSession.pages.icon, types.ExternalFile)
+
+    with pytest.raises(ValueError):
+        page.icon = "not an icon"
+
+
 def test_session_is_none(local_model):
     """Verify we raise expected errors when the session is None."""
 
@@ -55,6 +151,46 @@ def test_custom_model_page_id(local_model):
     assert page.id == page_id
 
 
+def test_custom_model_properties(local_model):
+    """Read property values through the connected properties of a model."""
+
+    data = {
+        "id": uuid4().hex,
+        "properties": {
+            "Name": types.Title["Local"].dict(),
+            "Index": types.Number[42].dict(),
+        },
+    }
+
+    page = local_model.parse_obj(data)
+
+    assert isinstance(local_model.Name, ConnectedProperty)
+    assert page.Name == "Local"
+    assert page.Index == 42
+
+
+def test_empty_status_property():
+    """Read an unset status property through a connected model."""
+
+    CustomPage = connected_page()
+
+    class _StatusModel(CustomPage):
+        __database__ = None
+
+        Stage = Property("Stage", schema.Status())
+
+    data = {
+        "id": uuid4().hex,
+        "properties": {
+            "Stage": {"type": "status", "status": None},
+        },
+    }
+
+    page = _StatusModel.parse_obj(data)
+
+    assert page.Stage is None
+
+
 @pytest.mark.vcr()
 def test_simple_model(notion, simple_model):
     """Create a simple object and verify connectivity."""
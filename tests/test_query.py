@@ -80,6 +80,64 @@ def test_invalid_filter():
         query.QueryBuilder(None).filter(bad_filter_name="INVALID")
 
 
+def test_timestamp_filters():
+    """Build timestamp filters from keyword arguments."""
+
+    find = query.QueryBuilder(None).filter(
+        timestamp="created_time",
+        created_time=query.DateCondition(is_empty=True),
+    )
+    assert isinstance(find.query.filter, query.CreatedTimeFilter)
+
+    find = query.QueryBuilder(None).filter(
+        timestamp=query.TimestampKind.LAST_EDITED_TIME,
+        last_edited_time=query.DateCondition(is_empty=True),
+    )
+    assert isinstance(find.query.filter, query.LastEditedTimeFilter)
+
+
+def test_chained_filters():
+    """Combine chained filters into a single compound filter."""
+
+    find = (
+        query.QueryBuilder(None)
+        .filter(property="Index", number=query.NumberCondition(greater_than=3))
+        .filter(property="Index", number=query.NumberCondition(less_than=8))
+        .filter(property="Name", rich_text=query.TextCondition(contains="Item"))
+    )
+
+    assert isinstance(find.query.filter, query.CompoundFilter)
+
+    data = find.query.dict()
+
+    assert len(data["filter"]["and"]) == 3
+    assert data["filter"]["and"][1] == {"property": "Index", "number": {"less_than": 8}}
+
+
+def test_filter_keeps_condition():
+    """Verify that conditions are used as given in a filter."""
+
+    condition = query.NumberCondition(equals=7)
+    find = query.QueryBuilder(None).filter(property="Index", number=condition)
+
+    assert find.query.filter.number is condition
+
+
+def test_invalid_timestamp_filter():
+    """Make sure that an unhashable timestamp gives an error."""
+    with pytest.raises(ValueError):
+        query.QueryBuilder(None).filter(timestamp=["created_time"])
+
+
+def test_sort_object():
+    """Add an existing PropertySort to a query."""
+
+    sort = query.PropertySort(property="Index")
+    find = query.QueryBuilder(None).sort(sort)
+
+    assert find.query.sorts == [sort]
+
+
 def test_invalid_sort():
     """Make sure that bad sort give an error."""
     with pytest.raises(ValueError):
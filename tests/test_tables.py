@@ -32,3 +32,15 @@ def test_create_basic_table(notion, test_area):
     assert new_table.Width == 2
 
     notion.blocks.delete(table)
+
+
+def test_table_row_cells():
+    """Verify that cells in a table row are accessible by column."""
+    row = blocks.TableRow["1", "test"]
+
+    assert row.Width == 2
+    assert row[0][0].plain_text == "1"
+    assert row[1][0].plain_text == "test"
+
+    with pytest.raises(IndexError):
+        row[2]
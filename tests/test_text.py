@@ -48,6 +48,17 @@ def test_plain_text():
     assert markdown(text) == "hello world"
 
 
+def test_style_is_copied():
+    """Verify that changing a style does not affect composed text."""
+    style = Annotations(bold=True)
+    text = TextObject["hello world", None, style]
+
+    style.bold = False
+
+    assert text.annotations.bold
+    assert text.annotations is not style
+
+
 def test_basic_links():
     """Verify text formatting for basic links."""
     text = TextObject["Search Me", "https://www.google.com/"]